@@ -2,6 +2,9 @@
 
 # Python 3 imports
 import functools
+import queue
+import sys
+import threading
 
 __all__ = (
     'MySQL',
@@ -17,6 +20,12 @@ class _Database:
 
     Provides only methods directly needed by the Warcraft plugin,
     so this is not really a flexible API.
+
+    Saving can be offloaded to a background thread through
+    :meth:`save_in_background`, so that the game's main thread doesn't
+    stall on disk writes. The queued writes are applied in order,
+    and reading methods wait for them to finish first so that they
+    never return outdated data.
     """
 
     def __init__(self, *args, **kwargs):
@@ -49,14 +58,78 @@ class _Database:
                 FOREIGN KEY (hero_id) REFERENCES heroes(class_id),
                 PRIMARY KEY (steamid, class_id)
             )''')
+        self._lock = threading.RLock()
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
 
     def close(self):
-        """Close the connection to the database."""
+        """Finish the queued writes and close the connection."""
+        self._write_queue.put(None)
+        self._writer.join()
         self._connection.close()
 
     def commit(self):
         """Commit changes to the database."""
-        self._connection.commit()
+        with self._lock:
+            self._connection.commit()
+
+    def save_in_background(self, players, heroes, skills):
+        """Save and commit data in the background writer thread.
+
+        :param iterable players:
+            Players' data to save with :meth:`save_players`
+        :param iterable heroes:
+            Heroes' data to save with :meth:`save_heroes`
+        :param iterable skills:
+            Skills' data to save with :meth:`save_skills`
+        """
+        self._write_queue.put((players, heroes, skills))
+
+    def _wait_for_writes(self):
+        """Wait for the queued writes to finish before reading.
+
+        If the writer thread has died, nothing will ever finish the
+        queued writes, so don't wait for them.
+        """
+        if self._writer.is_alive():
+            self._write_queue.join()
+
+    def _write_loop(self):
+        """Save queued data until ``None`` is received from the queue."""
+        while True:
+            data = self._write_queue.get()
+            try:
+                if data is None:
+                    return
+                self._write_batch(*data)
+            except Exception:
+                # Keep the writer alive, readers wait for the queue
+                sys.excepthook(*sys.exc_info())
+            finally:
+                self._write_queue.task_done()
+
+    def _write_batch(self, players, heroes, skills):
+        """Save and commit data in a single transaction.
+
+        If anything fails, the transaction is rolled back so that the
+        connection is never left inside an open transaction, which
+        would make the next batch's ``BEGIN`` fail as well.
+        """
+        with self._lock:
+            try:
+                with self.cursor() as cursor:
+                    cursor.execute('BEGIN')
+                self.save_players(players)
+                self.save_heroes(heroes)
+                self.save_skills(skills)
+                self.commit()
+            except Exception:
+                try:
+                    self._connection.rollback()
+                except Exception:
+                    sys.excepthook(*sys.exc_info())
+                raise
 
     def _connect(self, *args, **kwargs):
         """Connect to the database.
@@ -81,7 +154,8 @@ class _Database:
             SteamID of the player whose active hero to get
         """
         sql = 'SELECT active_hero_id FROM players WHERE steamid=?'
-        with self.cursor() as cursor:
+        self._wait_for_writes()
+        with self._lock, self.cursor() as cursor:
             cursor.execute(sql, (steamid,))
             data = cursor.fetchone()
             if data:
@@ -95,7 +169,8 @@ class _Database:
             SteamID of the player whose heroes' data to get
         """
         sql = 'SELECT class_id, level, xp FROM heroes WHERE steamid=?'
-        with self.cursor() as cursor:
+        self._wait_for_writes()
+        with self._lock, self.cursor() as cursor:
             cursor.execute(sql, (steamid,))
             return cursor.fetchall()
 
@@ -108,7 +183,8 @@ class _Database:
             ``class_id`` of the hero who owns the skills
         """
         sql = 'SELECT class_id, level FROM skills WHERE steamid=? AND hero_id=?'
-        with self.cursor() as cursor:
+        self._wait_for_writes()
+        with self._lock, self.cursor() as cursor:
             cursor.execute(sql, (steamid, hero_id))
             return cursor.fetchall()
 
@@ -122,7 +198,7 @@ class _Database:
         :param iterable individual_data:
             Individual data to insert to the database
         """
-        with self.cursor() as cursor:
+        with self._lock, self.cursor() as cursor:
             cursor.execute(query, individual_data)
 
     def _save_multiple_data(self, query, multiple_data):
@@ -135,7 +211,7 @@ class _Database:
         :param iterable multiple_data:
             Iterable of multiple datas to insert to the database
         """
-        with self.cursor() as cursor:
+        with self._lock, self.cursor() as cursor:
             cursor.executemany(query, multiple_data)
 
     _PLAYER_QUERY = 'INSERT OR REPLACE INTO players VALUES (?, ?)'
@@ -167,7 +243,18 @@ class SQLite(_Database):
 
     def _connect(self, *args, **kwargs):
         import sqlite3
-        return sqlite3.connect(*args, **kwargs)
+        # Writes happen in the background thread, guarded by self._lock
+        kwargs.setdefault('check_same_thread', False)
+        # The same few queries are executed over and over again
+        kwargs.setdefault('cached_statements', 256)
+        # Transactions are started explicitly by the writer thread
+        kwargs.setdefault('isolation_level', None)
+        connection = sqlite3.connect(*args, **kwargs)
+        # Write-ahead logging lets a commit append to the log instead of
+        # rewriting the database, and only the checkpoints need an fsync
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        return connection
 
     def cursor(self):
         import contextlib
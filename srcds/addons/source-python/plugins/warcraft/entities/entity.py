@@ -40,6 +40,8 @@ class Entity:
     method for managing the instance's current level.
     """
 
+    __slots__ = ('owner', '_level')
+
     @ClassProperty
     def class_id(cls):
         return cls.__qualname__
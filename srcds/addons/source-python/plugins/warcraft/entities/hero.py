@@ -1,6 +1,7 @@
 """A module with the :class:`Hero` base class for all heroes."""
 
 # Python 3 imports
+import bisect
 import math
 
 # Warcraft imports
@@ -20,12 +21,36 @@ class _HeroMeta(type):
 
     Also implements :meth:`skill` and :meth:`passive` decorators to
     easily add skills and passives to the hero.
+
+    Whenever a skill is added, the levels at which the hero's skills
+    get unlocked are precomputed into bitmasks, where bit ``i`` stands
+    for ``skill_classes[i]``. See :meth:`Hero.unlocked_skills_mask`.
     """
 
     def __init__(cls, *args, **kwargs):
         super().__init__(*args, **kwargs)
         cls.skill_classes = []
         cls.passive_classes = []
+        cls._update_skill_unlocks()
+
+    def _update_skill_unlocks(cls):
+        """Precompute the skill unlock bitmasks of the hero class.
+
+        Sets ``_skill_unlock_levels`` to the sorted distinct required
+        levels of the skills, and ``_skill_unlock_masks`` so that
+        ``_skill_unlock_masks[n]`` has the bits set for all the skills
+        unlocked by reaching the first ``n`` of those levels.
+        """
+        levels = sorted({skill_class.required_level for skill_class in cls.skill_classes})
+        masks = [0]
+        for level in levels:
+            mask = 0
+            for i, skill_class in enumerate(cls.skill_classes):
+                if skill_class.required_level <= level:
+                    mask |= 1 << i
+            masks.append(mask)
+        cls._skill_unlock_levels = tuple(levels)
+        cls._skill_unlock_masks = tuple(masks)
 
     def skill(cls, skill_class):
         """Add a skill class to the hero class's :attr:`skill_classes`.
@@ -48,6 +73,7 @@ class _HeroMeta(type):
             raise ValueError(
                 "Skill class {0} already added to a hero.".format(skill_class))
         cls.skill_classes.append(skill_class)
+        cls._update_skill_unlocks()
         return skill_class
 
     def passive(cls, skill_class):
@@ -84,6 +110,7 @@ class _HeroMeta(type):
             instance.skills.append(skill_class(instance))
         for skill_class in cls.passive_classes:
             instance.passives.append(skill_class(instance))
+        instance._refresh_event_dispatch()
         return instance
 
 
@@ -124,6 +151,11 @@ class Hero(Entity, metaclass=_HeroMeta):
         self._xp = xp
         self.skills = []
         self.passives = []
+        self._event_dispatch = {}
+        self._registered_events = frozenset()
+        # The spend skills menu's options and the levels they were built for
+        self._menu_cache_key = None
+        self._menu_cache_options = ()
 
     @property
     def xp(self):
@@ -200,6 +232,18 @@ class Hero(Entity, metaclass=_HeroMeta):
         used_points = sum(skill.level for skill in self.skills)
         return self.level - used_points
 
+    def unlocked_skills_mask(self):
+        """Get a bitmask of the skills unlocked by the hero's level.
+
+        Bit ``i`` is set if the hero's level is at least the
+        ``required_level`` of ``self.skills[i]``.
+
+        :returns int:
+            Bitmask of the unlocked skills
+        """
+        index = bisect.bisect_right(self._skill_unlock_levels, self.level)
+        return self._skill_unlock_masks[index]
+
     def can_upgrade_skill(self, skill):
         """Check if a hero can upgrade a skill.
 
@@ -252,14 +296,39 @@ class Hero(Entity, metaclass=_HeroMeta):
             warcraft.listeners.OnSkillDowngrade.manager.notify(
                 skill=skill, hero=self, player=self.owner)
 
+    def _refresh_event_dispatch(self):
+        """Rebuild the hero's event dispatch table.
+
+        Flattens the bound callbacks of all of the hero's skills into
+        a single ``(skill, callback, is_passive)`` tuple per event name,
+        so that :meth:`execute_skills` walks one contiguous sequence
+        instead of looping through every skill's callbacks separately.
+
+        Also updates :attr:`_registered_events` so that events which
+        none of the skills care about can be skipped before even
+        building their arguments.
+
+        Must be called whenever :attr:`skills` or :attr:`passives` change.
+        """
+        dispatch = {}
+        for skills, is_passive in ((self.skills, False), (self.passives, True)):
+            for skill in skills:
+                for event_name, callbacks in skill._callbacks:
+                    dispatch.setdefault(event_name, []).extend(
+                        (skill, callback, is_passive) for callback in callbacks)
+        self._event_dispatch = {
+            event_name: tuple(entries)
+            for event_name, entries in dispatch.items()
+        }
+        self._registered_events = frozenset(self._event_dispatch)
+
     def execute_skills(self, event_name, event_args):
         """Execute hero's skills for an event.
 
-        Forwards the arguments to the ``execute`` method of the skills
-        that have been upgraded to at least level one.
+        Forwards the arguments to the callbacks of the skills that
+        have been upgraded to at least level one, and to the callbacks
+        of all the passives.
         """
-        for skill in self.skills:
-            if skill.level > 0:
-                skill.execute(event_name, event_args)
-        for skill in self.passives:
-            skill.execute(event_name, event_args)
+        for skill, callback, is_passive in self._event_dispatch.get(event_name, ()):
+            if is_passive or skill.level > 0:
+                callback(event_args)
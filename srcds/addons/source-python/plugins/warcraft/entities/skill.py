@@ -2,10 +2,11 @@
 
 # Python 3 imports
 import collections
+import sys
 
 # Source.Python imports
+from hooks.exceptions import except_hooks
 from listeners.tick import Repeat
-from listeners.tick import RepeatStatus
 
 # Warcraft imports
 from warcraft.entities.entity import Entity
@@ -20,12 +21,15 @@ __all__ = (
 class _SkillMeta(type):
     """Metaclass for managing skills' callbacks.
 
-    Adds an :attr:`_event_callbacks` dictionary for each skill class
+    Adds an :attr:`_event_callbacks` tuple for each skill class
     and checks to see if any of the skill's methods have been decorated
     with the :func:`callback` function.
 
-    The decorated functions are added to the ``_event_callbacks`` dict
-    so that the method is the value and the event's name is the key.
+    The decorated functions are added to the ``_event_callbacks`` tuple
+    as ``(event_name, callbacks)`` pairs, where the event's name is
+    interned with :func:`sys.intern` so that comparing it to a string
+    literal succeeds on identity right away. Skills only listen to a few events, so scanning the pairs
+    is cheaper than hashing the event's name into a dictionary.
 
     For example:
 
@@ -34,33 +38,38 @@ class _SkillMeta(type):
         class MySkill(Skill):
 
             @event_callback('player_spawn', 'player_attack')
-            def my_callback(self, **event_args):
+            def my_callback(self, event_args):
                 ...
 
             @event_callback('player_jump')
-            def another_callback(self, **event_args):
+            def another_callback(self, event_args):
                 ...
 
-    Will result into the following ``_event_callbacks`` dictionary:
+    Will result into the following ``_event_callbacks`` tuple:
 
     .. code-block:: none
 
-        MySkill._event_callbacks = {
-            'player_attack': my_callback,
-            'player_jump': another_callback,
-            'player_spawn': my_callback,
-        }
+        MySkill._event_callbacks = (
+            ('player_spawn', (my_callback,)),
+            ('player_attack', (my_callback,)),
+            ('player_jump', (another_callback,)),
+        )
     """
 
     def __init__(cls, name, bases, attrs):
         """Initialize the skill class and register its callbacks."""
         super().__init__(name, bases, attrs)
-        cls._event_callbacks = collections.defaultdict(list)
+        event_callbacks = collections.defaultdict(list)
         for attr in attrs.values():
-            if not callable(attr) or not hasattr(attr, '_events'):
+            events = getattr(attr, '_events', None)
+            if events is None:
                 continue
-            for event_name in attr._events:
-                cls._event_callbacks[event_name].append(attr)
+            for event_name in events:
+                event_callbacks[event_name].append(attr)
+        cls._event_callbacks = tuple(
+            (sys.intern(event_name), tuple(callbacks))
+            for event_name, callbacks in event_callbacks.items()
+        )
 
 
 class Skill(Entity, metaclass=_SkillMeta):
@@ -83,11 +92,14 @@ class Skill(Entity, metaclass=_SkillMeta):
 
             # This will register the callback for 'player_spawn' event
             @Skill.event_callback('player_spawn')
-            def _boost_health(self, player, **eargs):
-                player.health += self.level * 5
+            def _boost_health(self, eargs):
+                eargs['player'].health += self.level * 5
 
     These registered callbacks will then be executed by
     the :meth:`execute` method automatically upon an event happening.
+    The event arguments are passed to the callbacks as a single
+    dictionary instead of keyword arguments, so that a new dictionary
+    doesn't need to be created for every callback.
 
     Skills can also be given cooldowns through the :attr:`cooldowns`
     dictionary:
@@ -95,26 +107,32 @@ class Skill(Entity, metaclass=_SkillMeta):
     .. code-block:: python
 
         @Skill.event_callback('player_attack')
-        def _add_skull(self, **eargs):
-            if self.cooldowns['attack'] <= 0:
+        def _add_skull(self, eargs):
+            if self.cooldowns.ready('attack'):
                 self.skulls += 1
-                self.cooldowns['attack'] = 8
+                self.cooldowns.arm('attack', 8)
 
         @Skill.event_callback('player_ultimate')
-        def _spend_skulls(self, player, **eargs):
-            cd = self.cooldowns['ultimate']
-            if cd <= 0:
+        def _spend_skulls(self, eargs):
+            if self.cooldowns.ready('ultimate'):
                 self.speed += self.skulls * 0.01 * self.level
                 self.health += self.skulls + self.level
-                self.cooldowns['ultimate'] = 40 - self.skulls
+                self.cooldowns.arm('ultimate', 40 - self.skulls)
                 self.skulls = 0
             else:
-                SayText2('Cooldown {cd}').send(player.index, cd=int(cd))
+                cd = self.cooldowns['ultimate']
+                index = eargs['player'].index
+                SayText2('Cooldown {cd}').send(index, cd=int(cd))
     """
 
+    __slots__ = ('cooldowns', '_callbacks')
+
     def __init__(self, owner, level=0):
         """Initialize the skill. Adds the :attr:`cooldowns` attribute.
 
+        Also binds the class's event callbacks to the instance
+        into :attr:`_callbacks` to speed up :meth:`execute`.
+
         :param object owner:
             The owner of the skill
         :param int level:
@@ -122,6 +140,10 @@ class Skill(Entity, metaclass=_SkillMeta):
         """
         super().__init__(owner, level)
         self.cooldowns = CooldownDict()
+        self._callbacks = tuple(
+            (event_name, tuple(callback.__get__(self) for callback in callbacks))
+            for event_name, callbacks in self._event_callbacks
+        )
 
     @staticmethod
     def event_callback(*event_names):
@@ -129,36 +151,83 @@ class Skill(Entity, metaclass=_SkillMeta):
 
         Adds an ``_events`` attribute for the callback which will later
         be used by :class:`_SkillMeta` to parse all of the callbacks.
+        The names are interned so that they share the string literals'
+        objects, which makes comparing them cheap.
 
         :param tuple \*event_names:
             Names of the events to register the callback for
         """
         def decorator(f):
-            f._events = event_names
+            f._events = tuple(sys.intern(name) for name in event_names)
             return f
         return decorator
 
+    @staticmethod
+    def jit_tick(signature):
+        """Compile an arithmetic-only helper function with Numba.
+
+        Meant for numeric per-tick logic of :class:`RepeatSkill`
+        subclasses, see its documentation for an example.
+        Define the decorated function at module level so that
+        Numba's on-disk cache can be reused between server restarts.
+
+        If :mod:`numba` is not installed, the function is returned
+        as it is and runs as regular Python.
+
+        :param str signature:
+            Numba signature of the function, e.g. ``'f8(f8, i8)'``
+        """
+        try:
+            from numba import njit
+        except ImportError:
+            return lambda function: function
+        return njit(signature, cache=True, fastmath=True)
+
     def execute(self, event_name, event_args):
         """Execute any registerd callbacks for the event.
 
+        Heroes dispatch events through their own table instead, so this
+        is only meant for calling a single skill's callbacks directly.
+
         :param str event_name:
             Name of the event which the callbacks should be registerd to
         :param dict event_args:
             Event arguments forwarded to the callbacks
         """
-        if event_name not in type(self)._event_callbacks:
-            return
-        for callback in type(self)._event_callbacks[event_name]:
-            callback(self, **event_args)
+        for name, callbacks in self._callbacks:
+            if name == event_name:
+                for callback in callbacks:
+                    callback(event_args)
+                return
 
 
 class RepeatSkill(Skill):
-    """A skill class which ticks repeatedly."""
+    """A skill class which ticks repeatedly.
+
+    Subclasses implement :meth:`_tick`. Heavy numeric work done on
+    every tick can be moved into a module level function compiled
+    with :meth:`Skill.jit_tick`:
+
+    .. code-block:: python
+
+        @Skill.jit_tick('f8(f8, i8)')
+        def _regenerate(health, level):
+            return health + level * 0.5
+
+        class Regeneration(RepeatSkill):
+            "Regenerate health every second."
+
+            def _tick(self):
+                player = self.owner.owner
+                player.health = int(_regenerate(player.health, self.level))
+    """
+
+    __slots__ = ('_ticker',)
 
     seconds_between_ticks = 1
 
     def __init__(self, owner, level=0):
-        """Initialize the skill. Adds :attr:`_repeat` attribute.
+        """Initialize the skill. Adds :attr:`_ticker` attribute.
 
         :param object owner:
             The owner of the skill
@@ -166,24 +235,76 @@ class RepeatSkill(Skill):
             Initial level of the skill
         """
         super().__init__(owner, level)
-        self._repeat = Repeat(self._tick)
+        self._ticker = None
 
     @Skill.level.setter
     def level(self, value):
-        Skill.level.fset(value)
+        Skill.level.fset(self, value)
         if value == 0:
             self.stop_repeat()
-        elif self._repeat.status == RepeatStatus.STOPPED:
+        elif self._ticker is None:
             self.start_repeat()
 
     def start_repeat(self, *args, **kwargs):
-        """Start the :attr:`tick_repeat`."""
-        self._repeat.start(self.seconds_between_ticks, 0)
+        """Start ticking the skill every :attr:`seconds_between_ticks`."""
+        if self._ticker is not None:
+            return
+        seconds = self.seconds_between_ticks
+        if seconds not in _tickers:
+            _tickers[seconds] = _Ticker(seconds)
+        self._ticker = _tickers[seconds]
+        self._ticker.add(self)
 
     def stop_repeat(self, *args, **kwargs):
-        """Stop the :attr:`tick_repeat`."""
-        self._repeat.stop()
+        """Stop ticking the skill."""
+        if self._ticker is None:
+            return
+        self._ticker.remove(self)
+        self._ticker = None
 
     def _tick(self):
-        """A method to call on every tick of :attr:`_tick_repeat`."""
+        """A method to call every :attr:`seconds_between_ticks`."""
         raise NotImplementedError
+
+
+class _Ticker:
+    """Ticks every :class:`RepeatSkill` with the same interval.
+
+    Instead of each skill running its own :class:`Repeat`, the skills
+    ticking at the same interval share a single one, which is only
+    running while there are skills to tick.
+    """
+
+    def __init__(self, seconds):
+        """Initialize the ticker.
+
+        :param float seconds:
+            Seconds between the ticks
+        """
+        self.seconds = seconds
+        self.skills = []
+        self._repeat = Repeat(self._tick_all)
+
+    def add(self, skill):
+        """Start ticking a skill, starting the repeat if needed."""
+        if not self.skills:
+            self._repeat.start(self.seconds, 0)
+        self.skills.append(skill)
+
+    def remove(self, skill):
+        """Stop ticking a skill, stopping the repeat if it was the last."""
+        self.skills.remove(skill)
+        if not self.skills:
+            self._repeat.stop()
+
+    def _tick_all(self):
+        """Tick all of the skills, isolating their errors."""
+        for skill in tuple(self.skills):  # Ticks may stop skills
+            try:
+                skill._tick()
+            except Exception:
+                except_hooks.print_exception()
+
+
+# Tickers shared by all the repeat skills, uses intervals as keys
+_tickers = {}
@@ -1,9 +1,7 @@
 """Utility functions/classes needed internally by the plugin."""
 
 # Python 3 imports
-import collections
 import importlib
-import inspect
 import pkgutil
 import time
 
@@ -14,6 +12,9 @@ __all__ = (
     'CooldownDict',
 )
 
+# Bound once to skip the module attribute lookup on every cooldown access
+_now = time.monotonic
+
 
 class ClassProperty:
     """Read-only property for classes instead of instances.
@@ -68,7 +69,7 @@ class ClassProperty:
         self.fget = fget
         self.__doc__ = doc
 
-    def __get__(self, obj=None, type_=None):
+    def __get__(self, obj, type_=None):
         """Call :attr:`fget` when the class property is read.
 
         :param object obj:
@@ -76,12 +77,11 @@ class ClassProperty:
         :param type type_:
             Class accessing the class property
 
-        If ``type_`` is ``None`` but an object was provided, ``type_``
-        will be recieved from ``type(obj)``.
+        Attribute access always provides ``type_``, but if the method
+        is called directly without it, ``type_`` will be recieved
+        from ``type(obj)``.
         """
-        if type_ is None and obj is not None:
-            type_ = type(obj)
-        return self.fget(type_)
+        return self.fget(type_ if type_ is not None else type(obj))
 
 
 def get_classes_from_module(module, *, private=False, imported=False):
@@ -94,12 +94,14 @@ def get_classes_from_module(module, *, private=False, imported=False):
     :param bool imported:
         Yield classes imported from other modules
     """
-    for obj_name, obj in inspect.getmembers(module):
+    module_name = module.__name__
+    # Sorted by name like inspect.getmembers(), heroes depend on the order
+    for obj_name, obj in sorted(module.__dict__.items()):
         if not private and obj_name.startswith('_'):
             continue
-        if not inspect.isclass(obj):
+        if not isinstance(obj, type):
             continue
-        if not imported and obj.__module__ != module.__name__:
+        if not imported and obj.__module__ != module_name:
             continue
         yield obj
 
@@ -114,7 +116,7 @@ def import_submodules(package, *, private_modules=False, recursive=True):
     :param bool recursive:
         Recursively also get classes from subpackages
     """
-    for loader, module_name, is_pkg in pkgutil.walk_packages(package.__path__):
+    for finder, module_name, is_pkg in pkgutil.iter_modules(package.__path__):
         if not private_modules and module_name.startswith('_'):
             continue
         full_name = package.__name__ + '.' + module_name
@@ -122,15 +124,21 @@ def import_submodules(package, *, private_modules=False, recursive=True):
         if not is_pkg:
             yield module
         elif recursive:
-            yield from import_submodules(module)
+            yield from import_submodules(
+                module, private_modules=private_modules)
 
 
-class CooldownDict(collections.defaultdict):
+class CooldownDict(dict):
     """A dictionary for managing cooldowns.
 
     For every individual cooldown, you must come up with an unique key.
     Good examples are the name of the function whose cooldown
     you're managing, or the function itself (if hashable).
+    Cooldowns which have never been set are considered to be ready.
+
+    Cooldowns are stored as absolute deadlines, so :meth:`ready` and
+    :meth:`arm` are the cheapest way to check and start a cooldown.
+    Indexing the dictionary still returns the remaining seconds.
 
     Example usage to prevent printing too often:
 
@@ -140,23 +148,50 @@ class CooldownDict(collections.defaultdict):
 
         # Can print once a second
         def slow_print(*args, **kwargs):
-            if cd_dict['slow_print'] <= 0:
+            if cd_dict.ready('slow_print'):
                 print(*args, **kwargs)
-                cd_dict['slow_print'] = 1
+                cd_dict.arm('slow_print', 1)
 
         # Can print once every three seconds, raises error
         def really_slow_and_dangerous_print(*args, **kwargs):
-            if cd_dict['really_slow_print'] > 0:
+            if not cd_dict.ready('really_slow_print'):
                 raise CooldownError  # user defined
             print(*args, **kwargs)
-            cd_dict['really_slow_print'] = 3
+            cd_dict.arm('really_slow_print', 3)
+
+    Timestamps come from :func:`time.monotonic`. While an event is
+    being dispatched, :attr:`_now_override` can be set to a single
+    timestamp so that every cooldown accessed during the dispatch
+    shares one clock read. Dispatches may nest, so remember to restore
+    the previous value afterwards instead of resetting it to ``None``.
     """
 
-    def __init__(self, default_factory=int, *args, **kwargs):
-        super().__init__(default_factory, *args, **kwargs)
+    __slots__ = ()
+
+    _now_override = None
+
+    def ready(self, key):
+        """Check if a cooldown has run out.
+
+        :param object key:
+            Key of the cooldown to check
+        :returns bool:
+            ``True`` if the cooldown is over or was never set
+        """
+        return dict.get(self, key, 0.0) <= (self._now_override or _now())
+
+    def arm(self, key, seconds):
+        """Start a cooldown.
+
+        :param object key:
+            Key of the cooldown to start
+        :param float seconds:
+            Duration of the cooldown in seconds
+        """
+        dict.__setitem__(self, key, (self._now_override or _now()) + seconds)
 
     def __getitem__(self, key):
-        return super().__getitem__(key) - time.time()
+        return dict.get(self, key, 0.0) - (self._now_override or _now())
 
     def __setitem__(self, key, value):
-        return super().__setitem__(key, value + time.time())
+        self.arm(key, value)
@@ -1,7 +1,10 @@
 """Main entry point for the plugin."""
 
 # Python 3 imports
-from collections import OrderedDict
+import bisect
+import collections.abc
+import functools
+import time
 
 # Source.Python imports
 from commands import CommandReturn
@@ -12,6 +15,7 @@ from entities.helpers import index_from_pointer
 from entities.hooks import EntityCondition
 from entities.hooks import EntityPreHook
 from events import Event
+from hooks.exceptions import except_hooks
 from listeners import OnLevelEnd
 from listeners.tick import Repeat
 from memory import make_object
@@ -30,6 +34,7 @@ import warcraft.database
 import warcraft.heroes
 import warcraft.listeners
 import warcraft.player
+from warcraft.utilities import CooldownDict
 
 
 # ======================================================================
@@ -50,28 +55,26 @@ def _new_player(index):
         hero = player.heroes[hero_id] = hero_class(player, level, xp)
 
         # And their skills
-        skill_datas = {
-            skill_id: level
-            for skill_id, level in g_database.get_skills_data(steamid, hero_id)
-        }
+        skill_datas = dict(g_database.get_skills_data(steamid, hero_id))
         for skill in hero.skills:
-            if skill.class_id in skill_datas:
-                skill.level = skill_datas[skill.class_id]
+            skill_level = skill_datas.get(skill.class_id)
+            if skill_level is not None:
+                skill.level = skill_level
 
     # Give the player all heroes available by his total level
+    heroes = player.heroes
     total_level = player.calculate_total_level()
-    for hero_id, hero_class in g_heroes.items():
-        if hero_id in player.heroes:
-            continue
-        if hero_class.required_level <= total_level:
-            player.heroes[hero_id] = g_heroes[hero_id](player)
+    split = bisect.bisect_right(_hero_required_levels, total_level)
+    for hero_id, hero_class in _hero_items[:split]:
+        if hero_id not in heroes:
+            heroes[hero_id] = hero_class(player)
 
     # Set player's active hero
-    active_hero_id = g_database.get_active_hero_id(steamid)
-    if active_hero_id is not None and active_hero_id in player.heroes:
-        player.hero = player.heroes[active_hero_id]
+    active_hero = heroes.get(g_database.get_active_hero_id(steamid))
+    if active_hero is not None:
+        player.hero = active_hero
     else:
-        player.hero = next(iter(player.heroes.values()))
+        player.hero = next(iter(heroes.values()))
 
     return player
 
@@ -86,47 +89,71 @@ def _serialize_player_data(player):
         # heroes
         (steamid, hero.class_id, hero.level, hero.xp),
         # skills
-        (
+        [
             (steamid, hero.class_id, skill.class_id, skill.level)
             for skill in hero.skills
-        ),
+        ],
     )
 
 
-def _save_player_data(player, *, commit=True):
+def _save_player_data(player):
     """Save individual player's data into the database."""
     player_data, hero_data, skills_data = _serialize_player_data(player)
-    g_database.save_player(player_data)
-    g_database.save_hero(hero_data)
-    g_database.save_skills(skills_data)
-    if commit:
-        g_database.commit()
+    g_database.save_in_background((player_data,), (hero_data,), skills_data)
 
 
-def _save_all_data(*, commit=True):
-    """Save every active player's data into the database."""
-    datas = (_serialize_player_data(player) for player in g_players.values())
-    try:
-        players, heroes, skills_list = zip(*datas)
-    except ValueError:
+def _save_all_data():
+    """Save every changed player's data into the database."""
+    if not _dirty_players:
         return
-    skills = [skill for skills in skills_list for skill in skills]  # Flatten
-    g_database.save_players(players)
-    g_database.save_heroes(heroes)
-    g_database.save_skills(skills)
-    if commit:
-        g_database.commit()
+    players, heroes, skills = [], [], []
+    for index in _dirty_players:
+        player = g_players.get(index)
+        if player is None:
+            continue
+        player_data, hero_data, skills_data = _serialize_player_data(player)
+        players.append(player_data)
+        heroes.append(hero_data)
+        skills.extend(skills_data)
+    _dirty_players.clear()
+    if not players:
+        return
+    g_database.save_in_background(players, heroes, skills)
+
+
+def _mark_dirty(player):
+    """Mark a player's data as changed so that it gets saved."""
+    _dirty_players.add(player.index)
+
+
+def _mark_dirty_on_change(player, **kwargs):
+    """Mark player's data as changed upon level or skill changes."""
+    _mark_dirty(player)
+
+
+# Stacked listener decorators would register each other instead of
+# the function, so register it on every listener's manager directly
+_dirty_marking_listeners = (
+    warcraft.listeners.OnHeroLevelUp,
+    warcraft.listeners.OnHeroLevelDown,
+    warcraft.listeners.OnSkillUpgrade,
+    warcraft.listeners.OnSkillDowngrade,
+)
+for _listener in _dirty_marking_listeners:
+    _listener.manager.register_listener(_mark_dirty_on_change)
 
 
 @OnLevelEnd
 def _save_data_on_level_end(*args, **kwargs):
-    """Save every active player's data into the database."""
+    """Save every changed player's data into the database."""
     _save_all_data()
 
 
 def unload():
-    """Store players' data and close the database."""
+    """Store changed players' data and close the database."""
     _data_save_repeat.stop()
+    for listener in _dirty_marking_listeners:
+        listener.manager.unregister_listener(_mark_dirty_on_change)
     _save_all_data()
     g_database.close()
 
@@ -134,32 +161,139 @@ def unload():
 @Event('player_disconnect')
 def _save_disconnecters_data(event):
     """Save player's data upon disconnect."""
+    _players_by_userid.pop(event['userid'], None)
     index = index_from_userid(event['userid'])
+    _dirty_players.discard(index)
     if index not in g_players:
         return
-    _save_player_data(g_players[index])
+    player = g_players[index]
+    # Run the skills here, the player is gone after his data is saved
+    try:
+        _execute_player_skills(player, event)
+    except Exception:
+        except_hooks.print_exception()
+    _save_player_data(player)
     del g_players[index]
 
 
+# ======================================================================
+# >> PLAYER LOOKUP
+# ======================================================================
+
+@Event('player_activate')
+def _cache_activated_player(event):
+    """Cache the player by his userid for the frequent events."""
+    userid = event['userid']
+    _players_by_userid[userid] = g_players.from_userid(userid)
+
+
+def _player_from_userid(userid):
+    """Get a player by his userid.
+
+    Uses the userid cache filled upon ``player_activate``, and falls
+    back to ``g_players`` for players who activated before the plugin
+    was loaded.
+    """
+    player = _players_by_userid.get(userid)
+    if player is None:
+        player = g_players.from_userid(userid)
+    return player
+
+
 # ======================================================================
 # >> SKILL EXECUTION CALLBACKS
 # ======================================================================
 
-@Event('player_jump', 'player_spawn', 'player_disconnect')
+class _EventView(collections.abc.Mapping):
+    """Read-only view of an event's variables for the skills.
+
+    Skills usually read only a few of the event's variables, so instead
+    of copying all of them into a dictionary with ``as_dict()``,
+    the variables are fetched from the event only upon access.
+    Fetched variables are stored into the ``extra`` dictionary, so
+    every variable is read from the event at most once no matter how
+    many skills need it. Values in the ``extra`` dictionary (like the
+    :class:`Player` objects) take precedence over the event's own
+    variables, and the ``hidden`` variables (like the userids which
+    have been replaced by players) are left out of the view.
+
+    Iterating the view or checking for a key copies the event's
+    variables once, so the view behaves like the dictionary which
+    the skills used to receive.
+    """
+
+    __slots__ = ('_variables', '_extra', '_hidden', '_event_dict')
+
+    def __init__(self, variables, extra, hidden=()):
+        """Initialize the view.
+
+        :param variables:
+            The event's variables
+        :param dict extra:
+            Additional values to look up before the event's variables
+        :param tuple hidden:
+            Names of the event's variables to leave out of the view
+        """
+        self._variables = variables
+        self._extra = extra
+        self._hidden = hidden
+        self._event_dict = None
+
+    def __getitem__(self, key):
+        try:
+            return self._extra[key]
+        except KeyError:
+            if key in self._hidden:
+                raise
+            value = self._extra[key] = self._variables[key]
+            return value
+
+    def __contains__(self, key):
+        return key in self._extra or key in self._get_event_dict()
+
+    def __iter__(self):
+        keys = list(self._extra)
+        keys.extend(key for key in self._get_event_dict() if key not in self._extra)
+        return iter(keys)
+
+    def __len__(self):
+        return len(self._extra.keys() | self._get_event_dict().keys())
+
+    def _get_event_dict(self):
+        """Get the event's variables without the hidden ones as a dict."""
+        if self._event_dict is None:
+            event_dict = self._variables.as_dict()
+            for key in self._hidden:
+                event_dict.pop(key, None)
+            self._event_dict = event_dict
+        return self._event_dict
+
+
+@Event('player_jump', 'player_spawn')
 def _execute_individual_skills(event):
     """Execute skills for events with only one player."""
-    event_args = event.variables.as_dict()
-    player = g_players.from_userid(event_args.pop('userid'))
-    if player.team in (2, 3):
-        event_args['player'] = player
-        player.hero.execute_skills(event.name, event_args)
+    _execute_player_skills(_player_from_userid(event['userid']), event)
 
 
-# Converter from event's name to attacker's and victim's event names
-_event_name_conversions = {
-    'player_death': ('player_kill', 'player_death'),
-    'player_hurt': ('player_attack', 'player_victim'),
-}
+def _execute_player_skills(player, event):
+    """Execute player's skills for an event with only him in it.
+
+    Also used for ``player_disconnect`` by :func:`_save_disconnecters_data`,
+    which must run the skills before removing the player.
+    """
+    if player.team not in (2, 3):
+        return
+    hero = player.hero
+    event_name = event.name
+    if event_name not in hero._registered_events:
+        return
+    event_args = _EventView(event.variables, {'player': player}, ('userid',))
+    now_override = CooldownDict._now_override
+    CooldownDict._now_override = time.monotonic()
+    try:
+        hero.execute_skills(event_name, event_args)
+    finally:
+        CooldownDict._now_override = now_override
 
 
 @Event('player_death', 'player_hurt')
@@ -167,17 +301,25 @@ def _execute_interaction_skills(event):
     """Execute skills for events with two players."""
     if not event['attacker'] or event['attacker'] == event['userid']:
         return
-    event_args = event.variables.as_dict()
-
-    attacker = g_players.from_userid(event_args.pop('attacker'))
-    victim = g_players.from_userid(event_args.pop('userid'))
-    event_args.update(attacker=attacker, victim=victim)
+    attacker = _player_from_userid(event['attacker'])
+    victim = _player_from_userid(event['userid'])
+    extra = {'attacker': attacker, 'victim': victim, 'player': attacker}
+    event_args = _EventView(event.variables, extra, ('attacker', 'userid'))
+
+    # Convert the event's name to attacker's and victim's event names
+    if event.name == 'player_death':
+        attacker_event, victim_event = 'player_kill', 'player_death'
+    else:
+        attacker_event, victim_event = 'player_attack', 'player_victim'
 
-    event_names = _event_name_conversions[event.name]
-    event_args['player'] = attacker
-    attacker.hero.execute_skills(event_names[0], event_args)
-    event_args['player'] = victim
-    victim.hero.execute_skills(event_names[1], event_args)
+    now_override = CooldownDict._now_override
+    CooldownDict._now_override = time.monotonic()
+    try:
+        attacker.hero.execute_skills(attacker_event, event_args)
+        extra['player'] = victim
+        victim.hero.execute_skills(victim_event, event_args)
+    finally:
+        CooldownDict._now_override = now_override
 
 
 @EntityPreHook(EntityCondition.is_player, 'on_take_damage')
@@ -195,10 +337,15 @@ def _execute_pre_damage_skills(args):
         'victim': victim,
         'take_damage_info': take_damage_info,
     }
-    event_args['player'] = attacker
-    attacker.hero.execute_skills('pre_player_attack', event_args)
-    event_args['player'] = victim
-    victim.hero.execute_skills('pre_player_victim', event_args)
+    now_override = CooldownDict._now_override
+    CooldownDict._now_override = time.monotonic()
+    try:
+        event_args['player'] = attacker
+        attacker.hero.execute_skills('pre_player_attack', event_args)
+        event_args['player'] = victim
+        victim.hero.execute_skills('pre_player_victim', event_args)
+    finally:
+        CooldownDict._now_override = now_override
 
 
 @ClientCommand('ultimate')
@@ -220,8 +367,9 @@ def _give_xp_from_kill(event):
     """Give the killing player XP from his kill."""
     if not event['attacker'] or event['attacker'] == event['userid']:
         return
-    attacker = g_players.from_userid(event['attacker'])
+    attacker = _player_from_userid(event['attacker'])
     attacker.hero.xp += 45 if event['headshot'] else 30
+    _mark_dirty(attacker)
 
 
 # ======================================================================
@@ -231,56 +379,63 @@ def _give_xp_from_kill(event):
 @Event('player_spawn')
 def _send_hero_info_message(event):
     """Send the player his current hero's information."""
-    player = g_players.from_userid(event['userid'])
-    if player.steamid != 'BOT':
+    player = _player_from_userid(event['userid'])
+    if not player.is_fake_client():
         _hero_info_message.send(player.index, hero=player.hero)
 
 
 @warcraft.listeners.OnHeroLevelUp
 def _send_level_up_message_and_menu(hero, player, levels):
-    """Send a level up message and menu to the player."""
-    _level_up_message.send(player.index, hero=hero)
-    spend_skills_menu.send(player.index)
+    """Send a level up message and menu to the player.
+
+    The menu is only sent if the hero has a skill to spend points on.
+    """
+    _level_up_message.send(player.index, hero=hero, levels=levels)
+    if hero.skill_points > 0 and not all(skill.on_max_level() for skill in hero.skills):
+        spend_skills_menu.send(player.index)
 
 
 # ======================================================================
 # >> CLIENT/SAY COMMANDS
 # ======================================================================
 
-@ClientCommand('warcraft')
-@SayCommand('warcraft')
-def _warcraft_command_callback(command, player_index, only=None):
-    main_menu.send(player_index)
-    return CommandReturn.BLOCK
-
+def _register_player_commands(commands):
+    """Register client and say commands which block the command.
 
-@ClientCommand('changehero')
-@SayCommand('changehero')
-def _changehero_command_callback(command, player_index, only=None):
-    change_hero_menu.send(player_index)
-    return CommandReturn.BLOCK
+    Both command types share one callback per command, which simply
+    forwards the player's index to the action and blocks the command.
 
+    :param dict commands:
+        Command names as keys and actions taking the player's index
+        as values
+    """
+    for name, action in commands.items():
+        def callback(command, player_index, only=None, action=action):
+            action(player_index)
+            return CommandReturn.BLOCK
+        ClientCommand(name)(callback)
+        SayCommand(name)(callback)
 
-@ClientCommand('spendskills')
-@SayCommand('spendskills')
-def _spendskills_command_callback(command, player_index, only=None):
-    spend_skills_menu.send(player_index)
-    return CommandReturn.BLOCK
 
-
-@ClientCommand('resetskills')
-@SayCommand('resetskills')
-def _resetskills_command_callback(command, player_index, only=None):
+def _reset_skills(player_index):
+    """Reset player's hero's skills and notify him."""
     g_players[player_index].hero.reset_skills()
     _skills_reset_message.send(player_index)
-    return CommandReturn.BLOCK
 
 
-@ClientCommand('heroinfo')
-@SayCommand('heroinfo')
-def _heroinfo_command_callback(command, player_index, only=None):
+def _send_hero_info(player_index):
+    """Send the player his current hero's information."""
     _hero_info_message.send(player_index, hero=g_players[player_index].hero)
-    return CommandReturn.BLOCK
+
+
+# The menus are defined later, so look them up upon use
+_register_player_commands({
+    'warcraft': lambda player_index: main_menu.send(player_index),
+    'changehero': lambda player_index: change_hero_menu.send(player_index),
+    'spendskills': lambda player_index: spend_skills_menu.send(player_index),
+    'resetskills': _reset_skills,
+    'heroinfo': _send_hero_info,
+})
 
 
 # ======================================================================
@@ -290,17 +445,28 @@ def _heroinfo_command_callback(command, player_index, only=None):
 # A dictionary of all the players, uses indexes as keys
 g_players = PlayerDictionary(_new_player)
 
+# Cache of the players from g_players, uses userids as keys
+_players_by_userid = {}
+
+# Indexes of the players whose data has changed since the last save
+_dirty_players = set()
+
 # A dictionary of the heroes from warcraft.heroes.__init__.get_heroes, ordered by required level.
-g_heroes = OrderedDict(
+g_heroes = dict(
     sorted(
         ((hero.class_id, hero) for hero in warcraft.heroes.get_heroes()),
         key=lambda item: item[1].required_level)
 )
 
+# Snapshots of g_heroes for the menus, the heroes don't change after loading
+_hero_items = tuple(g_heroes.items())
+_hero_classes = tuple(g_heroes.values())
+_hero_required_levels = tuple(hero.required_level for hero in _hero_classes)
+
 # Database wrapper for accessing the Warcraft database
 g_database = warcraft.database.SQLite(PLUGIN_DATA_PATH / 'warcraft.db')
 
-# A tick repeat for saving everyone's data every 4 minutes
+# A tick repeat for saving everyone's changed data every 4 minutes
 _data_save_repeat = Repeat(_save_all_data)
 _data_save_repeat.start(240, 0)
 
@@ -309,6 +475,23 @@ _tr = LangStrings('warcraft')
 _hero_info_message = SayText2(_tr['Hero Info'])
 _level_up_message = SayText2(_tr['Level Up'])
 _skills_reset_message = SayText2(_tr['Skills Reset'])
+_owned_hero_text = _tr['Owned Hero Text']
+_unowned_hero_text = _tr['Unowned Hero Text']
+_skill_points_text = _tr['Skill Points']
+_owned_skill_text = _tr['Owned Skill Text']
+_unowned_skill_text = _tr['Unowned Skill Text']
+
+
+@functools.lru_cache(maxsize=512)
+def _get_owned_hero_text(name, level):
+    """Get the change hero menu's text for an available hero."""
+    return _owned_hero_text.get_string(name=name, level=level)
+
+
+@functools.lru_cache(maxsize=128)
+def _get_skill_points_text(skill_points):
+    """Get the spend skills menu's description."""
+    return _skill_points_text.get_string(skill_points=skill_points)
 
 
 # ======================================================================
@@ -324,23 +507,18 @@ def _on_main_menu_build(menu, player_index):
     player = g_players[player_index]
     menu.clear()
     menu.description = player.hero.name
-    menu.extend([
-        PagedOption(_tr['Change Hero'], change_hero_menu),
-        PagedOption(_tr['Spend Skills'], spend_skills_menu),
-        PagedOption(_tr['Reset Skills'], 'reset'),
-        PagedOption(_tr['Hero Infos'], hero_infos_menu),
-    ])
+    menu.extend(_main_menu_options)
 
 
 @main_menu.register_select_callback
 def _on_main_menu_select(menu, player_index, choice):
     """React to a main menu selection."""
-    player = g_players[player_index]
-    if choice.value == 'reset':
-        player.hero.reset_skills()
+    value = choice.value
+    if value == 'reset':
+        g_players[player_index].hero.reset_skills()
         _skills_reset_message.send(player_index)
         return menu
-    return choice.value
+    return value
 
 
 change_hero_menu = PagedMenu(
@@ -355,27 +533,56 @@ def _on_change_hero_menu_build(menu, player_index):
     player = g_players[player_index]
     menu.clear()
     menu.description = player.hero.name
+    heroes = player.heroes
     total_level = player.calculate_total_level()
-    for hero_id, hero_class in g_heroes.items():
-        if hero_class.required_level <= total_level:
-            level = player.heroes[hero_id].level if hero_id in player.heroes else 0
-            text = _tr['Owned Hero Text'].get_string(name=hero_class.name, level=level)
-            menu.append(PagedOption(text, hero_class, True, True))
-        else:
-            text = _tr['Unowned Hero Text'].get_string(hero=hero_class)
-            menu.append(PagedOption(text, None, False, False))
+    # The heroes are sorted by required level, so find where the locked ones begin
+    split = bisect.bisect_right(_hero_required_levels, total_level)
+    levels = []
+    for hero_id, hero_class in _hero_items[:split]:
+        hero = heroes.get(hero_id)
+        levels.append(hero.level if hero is not None else 0)
+    menu.extend(_available_hero_options(tuple(levels)))
+    menu.extend(_locked_hero_options[split:])
+
+
+@functools.lru_cache(maxsize=256)
+def _available_hero_options(levels):
+    """Build the change hero menu's options for the available heroes.
+
+    The options only depend on the player's levels of the heroes,
+    so they are cached and shared between the players.
+
+    :param tuple levels:
+        Player's levels of the available heroes, ordered like ``g_heroes``
+    """
+    return tuple(
+        PagedOption(
+            _get_owned_hero_text(hero_class.name, level), hero_class, True, True)
+        for hero_class, level in zip(_hero_classes, levels)
+    )
+
+
+# Change hero menu's options for the heroes that are still locked
+_locked_hero_options = tuple(
+    PagedOption(
+        _unowned_hero_text.get_string(hero=hero_class), None, False, False)
+    for hero_class in _hero_classes
+)
 
 
 @change_hero_menu.register_select_callback
 def _on_change_hero_menu_select(menu, player_index, choice):
     """React to a change hero menu selection."""
     player = g_players[player_index]
-    hero_id = choice.value.class_id
-    if hero_id == player.hero.class_id:
+    hero_class = choice.value
+    if type(player.hero) is hero_class:
         return
-    if hero_id not in player.heroes:
-        player.heroes[hero_id] = choice.value(player)
-    player.hero = player.heroes[hero_id]
+    hero_id = hero_class.class_id
+    hero = player.heroes.get(hero_id)
+    if hero is None:
+        hero = player.heroes[hero_id] = hero_class(player)
+    player.hero = hero
+    _mark_dirty(player)
     player.client_command('kill', True)
 
 
@@ -389,22 +596,39 @@ def _on_spend_skills_menu_build(menu, player_index):
     hero = player.hero
     menu.clear()
     menu.title = hero.name
-    menu.description = _tr['Skill Points'].get_string(skill_points=hero.skill_points)
-    for skill in hero.skills:
-        if skill.required_level <= hero.level:
-            text = _tr['Owned Skill Text'].get_string(skill=skill)
+    menu.description = _get_skill_points_text(hero.skill_points)
+
+    # The options only change when the hero's or his skills' levels do
+    key = (hero.level, tuple(skill.level for skill in hero.skills))
+    if hero._menu_cache_key != key:
+        hero._menu_cache_options = _build_spend_skills_options(hero)
+        hero._menu_cache_key = key
+    menu.extend(hero._menu_cache_options)
+
+
+def _build_spend_skills_options(hero):
+    """Build the spend skills menu's options for a hero."""
+    options = []
+    unlocked = hero.unlocked_skills_mask()
+    # Same as hero.can_upgrade_skill(), without recounting the points
+    has_skill_points = hero.skill_points > 0
+    for i, skill in enumerate(hero.skills):
+        if unlocked >> i & 1:
+            text = _owned_skill_text.get_string(skill=skill)
         else:
-            text = _tr['Unowned Skill Text'].get_string(skill=skill)
-        can_upgrade = hero.can_upgrade_skill(skill)
-        menu.append(PagedOption(text, skill, can_upgrade, can_upgrade))
+            text = _unowned_skill_text.get_string(skill=skill)
+        can_upgrade = has_skill_points and not skill.on_max_level()
+        options.append(PagedOption(text, skill, can_upgrade, can_upgrade))
+    return tuple(options)
 
 
 @spend_skills_menu.register_select_callback
 def _on_spend_skills_menu_select(menu, player_index, choice):
     """React to an spend skills menu selection."""
     hero = g_players[player_index].hero
-    if hero.can_upgrade_skill(choice.value):
-        hero.upgrade_skill(choice.value)
+    skill = choice.value
+    if hero.can_upgrade_skill(skill):
+        hero.upgrade_skill(skill)
     return menu
 
 
@@ -413,12 +637,20 @@ hero_infos_menu = PagedMenu(
     parent_menu=main_menu,
 )
 
+# Main menu's options never change, only its description does
+_main_menu_options = (
+    PagedOption(_tr['Change Hero'], change_hero_menu),
+    PagedOption(_tr['Spend Skills'], spend_skills_menu),
+    PagedOption(_tr['Reset Skills'], 'reset'),
+    PagedOption(_tr['Hero Infos'], hero_infos_menu),
+)
+
 
 @hero_infos_menu.register_build_callback
 def _on_hero_infos_menu_build(menu, player_index):
     """Build the hero infos menu."""
     menu.clear()
-    for hero_class in g_heroes.values():
+    for hero_class in _hero_classes:
         menu.append(PagedOption(hero_class.name, hero_class))
 
 
@@ -443,6 +675,14 @@ class HeroInfoMenu(ListMenu):
         """Build the menu."""
         menu.clear()
         menu.title = menu.hero_class.name
-        for skill_cls in menu.hero_class.skill_classes:
-            text = '{s.name}\n{s.description}'.format(s=skill_cls)
-            menu.append(ListOption(text))
+        menu.extend(_skill_info_options[menu.hero_class])
+
+
+# Hero info menu's skill options for every hero class, built at load
+_skill_info_options = {
+    hero_class: tuple(
+        ListOption('{s.name}\n{s.description}'.format(s=skill_cls))
+        for skill_cls in hero_class.skill_classes
+    )
+    for hero_class in _hero_classes
+}